@@ -4,43 +4,297 @@ FastMCP server for managing tournament bot submissions
 """
 
 from fastmcp import FastMCP
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
-from pydantic import BaseModel, Field
-import requests
+from dataclasses import dataclass, fields
+from collections import Counter, defaultdict
+from itertools import count, islice
+from functools import lru_cache
+from contextlib import asynccontextmanager
+import heapq
+import httpx
+import orjson
+import asyncio
 import os
+import sys
+import logging
 import zipfile
+import tempfile
 import io
 
+# python-isal's ISA-L inflate is considerably faster than zlib. It is only used
+# by _InflateZipFile for this server's archive reads: patching zipfile.zlib would
+# affect every ZipFile in the process, and isal_zlib rejects compresslevel > 3.
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
+# HTTP/2 support in httpx needs the optional h2 package (httpx[http2])
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# Number of server sessions currently inside _lifespan
+_active_sessions = 0
+
+
+@asynccontextmanager
+async def _lifespan(server):
+    """Close the shared tournament API client once the last server session ends"""
+    global _aclient, _active_sessions
+    # Transports that start a session per client reopen the client after a close
+    if _aclient.is_closed:
+        _aclient = _make_client()
+    _active_sessions += 1
+    try:
+        yield {}
+    finally:
+        _active_sessions -= 1
+        if not _active_sessions:
+            await _aclient.aclose()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("Bot Submission API")
 
-# In-memory storage for demo purposes
+
+mcp = FastMCP("Bot Submission API", lifespan=_lifespan)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class Submission:
+    """Stored bot submission record"""
+    submission_id: str
+    bot_name: str
+    team_name: str
+    bot_version: str
+    repository_url: str
+    description: str
+    language: str
+    framework: str
+    status: str
+    submitted_at: str
+    updated_at: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a plain dict for tool responses.
+        
+        This is a fresh copy on purpose: responses can no longer mutate the
+        stored record (and its indexes) the way returning the stored dict did.
+        """
+        return {name: getattr(self, name) for name in _SUBMISSION_FIELDS}
+
+
+_SUBMISSION_FIELDS = tuple(f.name for f in fields(Submission))
+
+# In-memory storage for demo purposes. Filtering and aggregation are served by
+# the secondary indexes and counters below rather than by scanning this dict.
 # In production, this would connect to a real database
-submissions_db: Dict[str, Dict[str, Any]] = {}
+submissions_db: Dict[str, Submission] = {}
+
+# Monotonic sequence for submission IDs (stays unique after deletions)
+_id_counter = count(1)
+
+# Secondary indexes over submissions_db keyed by casefolded team name / status.
+# Buckets are dicts used as insertion-ordered sets of submission IDs. A team
+# never changes, so team buckets stay in submission order; status changes
+# append to the new status bucket, so those are re-ordered by _submission_seq.
+_by_team: Dict[str, Dict[str, None]] = defaultdict(dict)
+_by_status: Dict[str, Dict[str, None]] = defaultdict(dict)
+
+# Position of each submission in submissions_db order
+_seq_counter = count()
+_submission_seq: Dict[str, int] = {}
+
+# Running aggregates served directly by get_statistics
+_status_counts: Counter = Counter()
+_team_counts: Counter = Counter()
+_language_counts: Counter = Counter()
+
+
+def _decrement(counts: Counter, key: str) -> None:
+    """Decrement a counter, dropping the key once it reaches zero"""
+    counts[key] -= 1
+    if counts[key] <= 0:
+        del counts[key]
+
+
+def _index_submission(submission: Submission) -> None:
+    """Add a submission to the secondary indexes and statistics"""
+    submission_id = submission.submission_id
+    _submission_seq[submission_id] = next(_seq_counter)
+    _by_team[submission.team_name.casefold()][submission_id] = None
+    _by_status[submission.status.casefold()][submission_id] = None
+    
+    _status_counts[submission.status] += 1
+    _team_counts[submission.team_name] += 1
+    if submission.language:
+        _language_counts[submission.language] += 1
+
+
+def _unindex_submission(submission: Submission) -> None:
+    """Remove a submission from the secondary indexes and statistics"""
+    submission_id = submission.submission_id
+    _submission_seq.pop(submission_id, None)
+    for index, key in ((_by_team, submission.team_name.casefold()),
+                       (_by_status, submission.status.casefold())):
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(submission_id, None)
+            if not bucket:
+                del index[key]
+    
+    _decrement(_status_counts, submission.status)
+    _decrement(_team_counts, submission.team_name)
+    if submission.language:
+        _decrement(_language_counts, submission.language)
 
 
-class BotSubmission(BaseModel):
+def _set_status(submission: Submission, status: str) -> None:
+    """Change a submission's status, moving it between status buckets only"""
+    submission_id = submission.submission_id
+    old_key, new_key = submission.status.casefold(), status.casefold()
+    if old_key != new_key:
+        bucket = _by_status.get(old_key)
+        if bucket is not None:
+            bucket.pop(submission_id, None)
+            if not bucket:
+                del _by_status[old_key]
+        _by_status[new_key][submission_id] = None
+    
+    _decrement(_status_counts, submission.status)
+    submission.status = status
+    _status_counts[status] += 1
+
+
+@dataclass(slots=True)
+class BotSubmission:
     """Model for bot submission data"""
-    bot_name: str = Field(..., description="Name of the bot")
-    team_name: str = Field(..., description="Name of the team")
-    bot_version: str = Field(..., description="Version of the bot")
-    repository_url: str = Field(..., description="Git repository URL")
-    description: Optional[str] = Field(None, description="Bot description")
-    language: Optional[str] = Field(None, description="Programming language")
-    framework: Optional[str] = Field(None, description="Framework or platform used")
+    bot_name: str                       # Name of the bot
+    team_name: str                      # Name of the team
+    bot_version: str                    # Version of the bot
+    repository_url: str                 # Git repository URL
+    description: Optional[str] = None   # Bot description
+    language: Optional[str] = None      # Programming language
+    framework: Optional[str] = None     # Framework or platform used
 
 
 # API Base URL for tournament resources
 # TOURNAMENT_API_BASE = "http://4.210.232.147:8080"
 TOURNAMENT_API_BASE = "http://localhost:8080"
 
+# Shared async HTTP client so calls to the tournament API reuse pooled keep-alive
+# connections (multiplexed over HTTP/2 when the server supports it). With an
+# explicit transport the client ignores its own limits/http2, so they go here.
+def _make_client() -> httpx.AsyncClient:
+    """Create the tournament API client (closed again by _lifespan on shutdown)"""
+    return httpx.AsyncClient(
+        base_url=TOURNAMENT_API_BASE,
+        timeout=60,
+        transport=httpx.AsyncHTTPTransport(
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            retries=3
+        ),
+        headers={
+            "User-Agent": "BotSubmissionMCP/1.0",
+            "Accept": "application/json"
+        }
+    )
+
+
+_aclient = _make_client()
+
+# Tournament API endpoints, relative to the client's base URL
+_TEMPLATE_URL_FMT = "/api/resources/templates/{}"
+_VERIFY_URL = "/api/bots/verify"
+_SUBMIT_URL = "/api/bots/submit"
+
+# Request bodies are pre-serialized, so the content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Template downloads are streamed in chunks and spooled to disk above this size
+_DOWNLOAD_CHUNK_SIZE = 1 << 16
+_TEMPLATE_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+# The transport only retries failed connections; gateway errors on the template
+# download are retried here with exponential backoff (0.2s, 0.4s, 0.8s)
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_STATUS_RETRIES = 3
+_RETRY_BACKOFF = 0.2
+
 # Bypass verification mode (for testing/development only)
 _bypass_verification = False
 
 
+@asynccontextmanager
+async def _stream_get(url: str, **kwargs):
+    """Stream a GET request, retrying gateway error responses"""
+    for attempt in range(_STATUS_RETRIES + 1):
+        async with _aclient.stream("GET", url, **kwargs) as response:
+            if response.status_code not in _RETRY_STATUSES or attempt == _STATUS_RETRIES:
+                yield response
+                return
+        await asyncio.sleep(_RETRY_BACKOFF * 2 ** attempt)
+
+
+class _InflateZipFile(zipfile.ZipFile):
+    """ZipFile that inflates DEFLATE members with ISA-L when python-isal is installed"""
+    
+    def open(self, name, mode="r", pwd=None, *, force_zip64=False):
+        member = super().open(name, mode, pwd=pwd, force_zip64=force_zip64)
+        # Nothing has been inflated yet, so the decompressor can still be swapped
+        if isal_zlib is not None and mode == "r" and member._compress_type == zipfile.ZIP_DEFLATED:
+            member._decompressor = isal_zlib.decompressobj(-15)
+        return member
+
+
+@lru_cache(maxsize=8)
+def _extract_files_cached(zip_file_path: str, mtime_ns: int, size: int) -> Tuple[Tuple[str, str], ...]:
+    """
+    Read the submission files out of a ZIP archive.
+    
+    mtime_ns and size are only part of the cache key so that a rewritten
+    archive at the same path is extracted again.
+    """
+    files = []
+    with _InflateZipFile(zip_file_path, 'r') as zip_ref:
+        for zinfo in zip_ref.infolist():
+            # Skip directories, hidden files and anything inside a hidden directory
+            # (.git/, .vs/, ...); accept either separator as os.path.basename does on Windows
+            if zinfo.is_dir():
+                continue
+            parts = zinfo.filename.replace('\\', '/').split('/')
+            base_name = parts[-1]
+            if not base_name or any(part.startswith('.') for part in parts):
+                continue
+                
+            # Decode incrementally while inflating instead of buffering raw bytes first
+            with io.TextIOWrapper(zip_ref.open(zinfo), encoding='utf-8', errors='ignore', newline='') as file:
+                files.append((base_name, file.read()))
+    return tuple(files)
+
+
+def _extract_template(archive, output_directory: str) -> List[str]:
+    """Extract a downloaded template archive, returning the extracted entry names"""
+    with _InflateZipFile(archive) as zip_ref:
+        infos = zip_ref.infolist()
+        zip_ref.extractall(output_directory, members=infos)
+        return [zinfo.filename for zinfo in infos]
+
+
+def _extract_files(zip_file_path: str, st: os.stat_result) -> Tuple[Tuple[str, str], ...]:
+    """Return (FileName, Code) pairs for a ZIP archive, reusing recent extractions"""
+    return _extract_files_cached(zip_file_path, st.st_mtime_ns, st.st_size)
+
+
 @mcp.tool()
-def download_template(
+async def download_template(
     template_name: str,
     output_directory: str = "."
 ) -> Dict[str, Any]:
@@ -56,34 +310,38 @@ def download_template(
     """
     try:
         # Construct API URL
-        url = f"{TOURNAMENT_API_BASE}/api/resources/templates/{template_name}"
-        
-        # Make GET request
-        response = requests.get(url, timeout=30)
+        url = _TEMPLATE_URL_FMT.format(template_name)
         
-        if response.status_code == 200:
+        # Make GET request, streaming the body instead of buffering it in memory
+        async with _stream_get(url, timeout=30) as response:
+            if response.status_code != 200:
+                await response.aread()
+                return {
+                    "success": False,
+                    "error": f"Failed to download template. Status code: {response.status_code}",
+                    "message": response.text
+                }
+            
             # Create output directory if it doesn't exist
             os.makedirs(output_directory, exist_ok=True)
             
-            # Extract ZIP content
-            with zipfile.ZipFile(io.BytesIO(response.content)) as zip_ref:
-                zip_ref.extractall(output_directory)
-                extracted_files = zip_ref.namelist()
-            
-            return {
-                "success": True,
-                "message": f"Template '{template_name}' downloaded and extracted successfully",
-                "output_directory": os.path.abspath(output_directory),
-                "extracted_files": extracted_files
-            }
-        else:
-            return {
-                "success": False,
-                "error": f"Failed to download template. Status code: {response.status_code}",
-                "message": response.text
-            }
+            # Spool the archive to memory (spilling to disk for large templates)
+            with tempfile.SpooledTemporaryFile(max_size=_TEMPLATE_SPOOL_MAX_SIZE) as buf:
+                async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                    buf.write(chunk)
+                buf.seek(0)
+                
+                # Extract ZIP content on a worker thread so the event loop keeps running
+                extracted_files = await asyncio.to_thread(_extract_template, buf, output_directory)
+        
+        return {
+            "success": True,
+            "message": f"Template '{template_name}' downloaded and extracted successfully",
+            "output_directory": os.path.abspath(output_directory),
+            "extracted_files": extracted_files
+        }
             
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {
             "success": False,
             "error": f"Network error while downloading template: {str(e)}"
@@ -101,7 +359,7 @@ def download_template(
 
 
 @mcp.tool()
-def verify_bot_submission(
+async def verify_bot_submission(
     zip_file_path: str,
     team_name: str = "DefaultTeam"
 ) -> Dict[str, Any]:
@@ -116,27 +374,20 @@ def verify_bot_submission(
         Dictionary containing verification results including errors and warnings
     """
     try:
-        # Check if the ZIP file exists
-        if not os.path.exists(zip_file_path):
+        # Check if the ZIP file exists (the stat result also keys the extraction cache)
+        try:
+            st = os.stat(zip_file_path)
+        except FileNotFoundError:
             return {
                 "success": False,
                 "error": f"File not found: {zip_file_path}"
             }
         
-        # Extract files from ZIP
-        files_data = []
-        with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-            for file_name in zip_ref.namelist():
-                # Skip directories and hidden files
-                if file_name.endswith('/') or file_name.startswith('.'):
-                    continue
-                    
-                with zip_ref.open(file_name) as file:
-                    content = file.read().decode('utf-8', errors='ignore')
-                    files_data.append({
-                        "FileName": os.path.basename(file_name),
-                        "Code": content
-                    })
+        # Extract files from ZIP on a worker thread so the event loop keeps running
+        files_data = [
+            {"FileName": file_name, "Code": content}
+            for file_name, content in await asyncio.to_thread(_extract_files, zip_file_path, st)
+        ]
         
         if not files_data:
             return {
@@ -151,18 +402,18 @@ def verify_bot_submission(
         }
         
         # Debug: Log file names being sent
-        print(f"DEBUG - Sending {len(files_data)} files:")
-        for i, f in enumerate(files_data[:5]):  # Show first 5
-            print(f"  {i+1}. {f['FileName']} ({len(f['Code'])} chars)")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sending %d files:", len(files_data))
+            for i, f in enumerate(files_data[:5]):  # Show first 5
+                logger.debug("  %d. %s (%d chars)", i + 1, f['FileName'], len(f['Code']))
         
         # Call tournament API verify endpoint
-        url = f"{TOURNAMENT_API_BASE}/api/bots/verify"
-        response = requests.post(url, json=payload, timeout=60)
+        response = await _aclient.post(_VERIFY_URL, content=orjson.dumps(payload), headers=_JSON_HEADERS)
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             # Debug: Log the actual response
-            print(f"DEBUG - API Response: {result}")
+            logger.debug("API Response: %s", result)
             # API returns camelCase fields
             return {
                 "success": result.get("success", result.get("isValid", False)),
@@ -185,7 +436,7 @@ def verify_bot_submission(
             "success": False,
             "error": "Invalid ZIP file"
         }
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {
             "success": False,
             "error": f"Network error: {str(e)}"
@@ -198,7 +449,7 @@ def verify_bot_submission(
 
 
 @mcp.tool()
-def submit_bot_to_tournament(
+async def submit_bot_to_tournament(
     zip_file_path: str,
     team_name: str,
     overwrite: bool = True
@@ -215,27 +466,20 @@ def submit_bot_to_tournament(
         Dictionary containing submission results
     """
     try:
-        # Check if the ZIP file exists
-        if not os.path.exists(zip_file_path):
+        # Check if the ZIP file exists (the stat result also keys the extraction cache)
+        try:
+            st = os.stat(zip_file_path)
+        except FileNotFoundError:
             return {
                 "success": False,
                 "error": f"File not found: {zip_file_path}"
             }
         
-        # Extract files from ZIP
-        files_data = []
-        with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-            for file_name in zip_ref.namelist():
-                # Skip directories and hidden files
-                if file_name.endswith('/') or file_name.startswith('.'):
-                    continue
-                    
-                with zip_ref.open(file_name) as file:
-                    content = file.read().decode('utf-8', errors='ignore')
-                    files_data.append({
-                        "FileName": os.path.basename(file_name),
-                        "Code": content
-                    })
+        # Extract files from ZIP on a worker thread so the event loop keeps running
+        files_data = [
+            {"FileName": file_name, "Code": content}
+            for file_name, content in await asyncio.to_thread(_extract_files, zip_file_path, st)
+        ]
         
         if not files_data:
             return {
@@ -251,11 +495,10 @@ def submit_bot_to_tournament(
         }
         
         # Call tournament API submit endpoint
-        url = f"{TOURNAMENT_API_BASE}/api/bots/submit"
-        response = requests.post(url, json=payload, timeout=60)
+        response = await _aclient.post(_SUBMIT_URL, content=orjson.dumps(payload), headers=_JSON_HEADERS)
         
         if response.status_code == 200:
-            result = response.json()
+            result = orjson.loads(response.content)
             return {
                 "success": result.get("Success", False),
                 "team_name": result.get("TeamName"),
@@ -276,7 +519,7 @@ def submit_bot_to_tournament(
             "success": False,
             "error": "Invalid ZIP file"
         }
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         return {
             "success": False,
             "error": f"Network error: {str(e)}"
@@ -288,6 +531,53 @@ def submit_bot_to_tournament(
         }
 
 
+@mcp.tool()
+async def verify_and_submit(
+    zip_file_path: str,
+    team_name: str,
+    overwrite: bool = True,
+    concurrent: bool = False
+) -> Dict[str, Any]:
+    """
+    Verify a bot submission and submit it to the tournament in one call.
+    
+    By default the bot is only submitted once verification has passed.
+    With concurrent (and overwrite) enabled, the verify and submit requests
+    are sent at the same time instead: the team's live submission is then
+    replaced before the verification result is known, even if it fails.
+    
+    Args:
+        zip_file_path: Path to the ZIP file containing bot submission files
+        team_name: Name of the team submitting the bot
+        overwrite: Whether to overwrite existing submission (default: True)
+        concurrent: Submit without waiting for verification (default: False)
+    
+    Returns:
+        Dictionary containing both the verification and submission results
+    """
+    if concurrent and overwrite:
+        verification, submission = await asyncio.gather(
+            verify_bot_submission(zip_file_path, team_name),
+            submit_bot_to_tournament(zip_file_path, team_name, overwrite)
+        )
+    else:
+        verification = await verify_bot_submission(zip_file_path, team_name)
+        if not verification.get("is_valid", False):
+            return {
+                "success": False,
+                "error": "Verification failed, bot was not submitted",
+                "verification": verification,
+                "submission": None
+            }
+        submission = await submit_bot_to_tournament(zip_file_path, team_name, overwrite)
+    
+    return {
+        "success": bool(verification.get("is_valid", False) and submission.get("success", False)),
+        "verification": verification,
+        "submission": submission
+    }
+
+
 @mcp.tool()
 def submit_bot(
     bot_name: str,
@@ -313,29 +603,33 @@ def submit_bot(
     Returns:
         Dictionary containing submission ID and confirmation details
     """
-    submission_id = f"sub_{len(submissions_db) + 1}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-    
-    submission = {
-        "submission_id": submission_id,
-        "bot_name": bot_name,
-        "team_name": team_name,
-        "bot_version": bot_version,
-        "repository_url": repository_url,
-        "description": description,
-        "language": language,
-        "framework": framework,
-        "status": "pending",
-        "submitted_at": datetime.now().isoformat(),
-        "updated_at": datetime.now().isoformat()
-    }
+    now = datetime.now()
+    submission_id = f"sub_{next(_id_counter)}_{now.strftime('%Y%m%d%H%M%S')}"
+    timestamp = now.isoformat()
+    
+    # Categorical fields are interned so equal values share one string object
+    submission = Submission(
+        submission_id=submission_id,
+        bot_name=bot_name,
+        team_name=sys.intern(team_name),
+        bot_version=bot_version,
+        repository_url=repository_url,
+        description=description,
+        language=sys.intern(language),
+        framework=sys.intern(framework),
+        status="pending",
+        submitted_at=timestamp,
+        updated_at=timestamp
+    )
     
     submissions_db[submission_id] = submission
+    _index_submission(submission)
     
     return {
         "success": True,
         "submission_id": submission_id,
         "message": f"Bot '{bot_name}' successfully submitted by team '{team_name}'",
-        "submission": submission
+        "submission": submission.to_dict()
     }
 
 
@@ -358,7 +652,7 @@ def get_submission(submission_id: str) -> Dict[str, Any]:
     
     return {
         "success": True,
-        "submission": submissions_db[submission_id]
+        "submission": submissions_db[submission_id].to_dict()
     }
 
 
@@ -379,17 +673,37 @@ def list_submissions(
     Returns:
         Dictionary containing list of submissions
     """
-    submissions = list(submissions_db.values())
-    
-    # Apply filters
+    # Resolve filters through the secondary indexes
+    buckets = []
     if team_name:
-        submissions = [s for s in submissions if s["team_name"].lower() == team_name.lower()]
-    
+        buckets.append(_by_team.get(team_name.casefold(), {}))
+    status_bucket = None
     if status:
-        submissions = [s for s in submissions if s["status"].lower() == status.lower()]
-    
-    # Apply limit
-    submissions = submissions[:limit]
+        status_bucket = _by_status.get(status.casefold(), {})
+        buckets.append(status_bucket)
+    
+    if not buckets:
+        matches = iter(submissions_db)
+        in_order = True
+    else:
+        # Walk the smallest bucket (the team one on ties) and keep IDs present in every other bucket
+        buckets.sort(key=len)
+        smallest, others = buckets[0], buckets[1:]
+        matches = (sid for sid in smallest if all(sid in b for b in others))
+        in_order = smallest is not status_bucket
+    
+    seq = _submission_seq.__getitem__
+    if limit < 0:
+        # Negative limits drop submissions from the end, as slicing always has
+        ids = (list(matches) if in_order else sorted(matches, key=seq))[:limit]
+    elif in_order:
+        # Apply limit lazily so matching stops after 'limit' submissions
+        ids = islice(matches, limit)
+    else:
+        ids = heapq.nsmallest(limit, matches, key=seq)
+    
+    # Only the returned page is converted to response dicts
+    submissions = [submissions_db[sid].to_dict() for sid in ids]
     
     return {
         "success": True,
@@ -429,20 +743,20 @@ def update_submission(
     
     # Update fields if provided
     if bot_version is not None:
-        submission["bot_version"] = bot_version
+        submission.bot_version = bot_version
     if description is not None:
-        submission["description"] = description
+        submission.description = description
     if repository_url is not None:
-        submission["repository_url"] = repository_url
+        submission.repository_url = repository_url
     if status is not None:
-        submission["status"] = status
+        _set_status(submission, sys.intern(status))
     
-    submission["updated_at"] = datetime.now().isoformat()
+    submission.updated_at = datetime.now().isoformat()
     
     return {
         "success": True,
         "message": f"Submission '{submission_id}' updated successfully",
-        "submission": submission
+        "submission": submission.to_dict()
     }
 
 
@@ -464,11 +778,12 @@ def delete_submission(submission_id: str) -> Dict[str, Any]:
         }
     
     deleted_submission = submissions_db.pop(submission_id)
+    _unindex_submission(deleted_submission)
     
     return {
         "success": True,
         "message": f"Submission '{submission_id}' deleted successfully",
-        "deleted_submission": deleted_submission
+        "deleted_submission": deleted_submission.to_dict()
     }
 
 
@@ -494,11 +809,11 @@ def get_submission_status(submission_id: str) -> Dict[str, Any]:
     return {
         "success": True,
         "submission_id": submission_id,
-        "bot_name": submission["bot_name"],
-        "team_name": submission["team_name"],
-        "status": submission["status"],
-        "submitted_at": submission["submitted_at"],
-        "updated_at": submission["updated_at"]
+        "bot_name": submission.bot_name,
+        "team_name": submission.team_name,
+        "status": submission.status,
+        "submitted_at": submission.submitted_at,
+        "updated_at": submission.updated_at
     }
 
 
@@ -510,32 +825,13 @@ def get_statistics() -> Dict[str, Any]:
     Returns:
         Dictionary containing submission statistics
     """
-    total = len(submissions_db)
-    
-    status_counts = {}
-    team_counts = {}
-    language_counts = {}
-    
-    for submission in submissions_db.values():
-        # Count by status
-        status = submission["status"]
-        status_counts[status] = status_counts.get(status, 0) + 1
-        
-        # Count by team
-        team = submission["team_name"]
-        team_counts[team] = team_counts.get(team, 0) + 1
-        
-        # Count by language
-        language = submission.get("language", "unknown")
-        if language:
-            language_counts[language] = language_counts.get(language, 0) + 1
-    
+    # Counts are maintained incrementally by submit/update/delete
     return {
         "success": True,
-        "total_submissions": total,
-        "by_status": status_counts,
-        "by_team": team_counts,
-        "by_language": language_counts
+        "total_submissions": len(submissions_db),
+        "by_status": dict(_status_counts),
+        "by_team": dict(_team_counts),
+        "by_language": dict(_language_counts)
     }
 
 
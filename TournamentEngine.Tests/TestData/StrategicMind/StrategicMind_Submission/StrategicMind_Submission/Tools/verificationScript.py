@@ -16,15 +16,43 @@ import sys
 import re
 import time
 import json
+import tempfile
+import functools
+import io
+import mmap
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Iterator, Optional, Union
 
 # Configuration
 USERBOT_DIR = Path(__file__).parent / "UserBot"
 STRATEGICMIND_DIR = USERBOT_DIR / "UserBot.StrategicMind"
 TEST_DIR = USERBOT_DIR / "UserBot.StrategicMind.Tests"
+STRATEGICMIND_CSPROJ = str(STRATEGICMIND_DIR / "UserBot.StrategicMind.csproj")
+TESTS_CSPROJ = str(TEST_DIR / "UserBot.StrategicMind.Tests.csproj")
+USERBOT_ROOT_STR = str(USERBOT_DIR)
 REQUIRED_COVERAGE_PERCENT = 50.0
 MAX_EXECUTION_TIME_MS = 300  # 0.3 seconds
+BUILD_OUTPUT_DIRS = frozenset({'obj', 'bin'})  # Pruned from source walks
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # Threads for per-file source scans
+MMAP_MIN_SIZE = 64 * 1024  # Larger source files are memory-mapped instead of read
+
+# Precompiled patterns
+TOTAL_TIME_RE = re.compile(r'Total time: ([\d.]+) Seconds')
+# Candidate lines containing ';;' that are not // or * comment lines. The lookahead
+# skips the common (ASCII/NBSP-indented) comments; matches are re-checked with
+# str.strip() so comments indented with other Unicode whitespace are skipped too.
+DBL_SEMI_RE = re.compile(rb'(?m)^(?!(?:[ \t\r\f\v]|\xc2\xa0)*(?://|\*))[^\n]*;;')
+# Lines that open or close a /* ... */ block
+COMMENT_MARK_RE = re.compile(r'(?m)^[^\n]*(?:/\*|\*/)[^\n]*$')
+# Lines that may end a statement: anything with ';' (including get;/set;) or '=>'
+STMT_CANDIDATE_RE = re.compile(r'(?m)^[^\n]*(?:;|=>)[^\n]*$')
+# Classifies a stripped candidate line in one match (see match.lastgroup):
+#   skip - comments, attributes, for loops, LINQ continuations, lambdas and '{;'/'};'
+#   done - statement already ending with //
+#   stmt - statement missing the trailing //
+STMT_CLASS_RE = re.compile(r'(?P<skip>//|\[.*\]$|for \(|\.|async \(\) =>|[{}];$)|(?P<done>.*//$)|(?P<stmt>)')
 
 # ANSI color codes
 GREEN = '\033[92m'
@@ -56,62 +84,161 @@ def print_info(text: str):
     """Print info message"""
     print(f"{BLUE}ℹ {text}{RESET}")
 
+def _scandir_cs(path) -> Iterator[str]:
+    """Recursively yield paths of .cs files, skipping symlinks and obj/bin build output"""
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir():
+                    if entry.name not in BUILD_OUTPUT_DIRS:
+                        subdirs.append(entry.path)
+                elif entry.is_file() and entry.name.endswith('.cs'):
+                    yield entry.path
+    except PermissionError:
+        pass
+    
+    # Descend after the directory handle is closed
+    for subdir in subdirs:
+        yield from _scandir_cs(subdir)
+
+@functools.lru_cache(maxsize=None)
+def _list_cs_files(root: str) -> Tuple[str, ...]:
+    """List the .cs files under root once per run; all checks share the cached walk"""
+    return tuple(_scandir_cs(root))
+
+def _read_output(output_file) -> str:
+    """Read back subprocess output that was redirected to a temp file"""
+    output_file.seek(0)
+    return output_file.read().decode('utf-8', errors='replace')
+
 def check_compilation() -> bool:
     """Check if the UserBot compiles successfully"""
     print_header("VERIFICATION 1: COMPILATION")
     
     try:
-        result = subprocess.run(
-            ["dotnet", "build", str(STRATEGICMIND_DIR / "UserBot.StrategicMind.csproj")],
-            capture_output=True,
-            text=True,
-            cwd=USERBOT_DIR
-        )
-        
-        if result.returncode == 0:
-            print_success("UserBot.StrategicMind compiles successfully")
-            return True
-        else:
-            print_error("Compilation failed")
-            print(f"\n{RED}Build Output:{RESET}")
-            print(result.stdout)
-            print(result.stderr)
-            return False
+        # Build output goes to a temp file and is only read back on failure
+        with tempfile.TemporaryFile() as build_output:
+            result = subprocess.run(
+                ["dotnet", "build", STRATEGICMIND_CSPROJ],
+                stdout=build_output,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=USERBOT_DIR
+            )
+            
+            if result.returncode == 0:
+                print_success("UserBot.StrategicMind compiles successfully")
+                return True
+            else:
+                print_error("Compilation failed")
+                print(f"\n{RED}Build Output:{RESET}")
+                print(_read_output(build_output))
+                print(result.stderr)
+                return False
     except Exception as e:
         print_error(f"Failed to run compilation: {e}")
         return False
 
-def check_double_semicolons() -> bool:
+def _read_bytes(cs_file: str) -> Union[bytes, mmap.mmap]:
+    """Read a file's raw contents, as a read-only memory map for large files"""
+    with open(cs_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > MMAP_MIN_SIZE:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return f.read()
+
+def _load_cs_files(root: str) -> Dict[str, bytes]:
+    """Read every .cs file under root once so several checks can share the contents
+
+    Values are bytes, or read-only mmaps for files over MMAP_MIN_SIZE; the
+    scanners only use operations both support (find, slicing, regex, str()).
+    """
+    cs_files = _list_cs_files(root)
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        futures = [executor.submit(_read_bytes, cs_file) for cs_file in cs_files]
+    
+    files = {}
+    for cs_file, future in zip(cs_files, futures):
+        try:
+            files[cs_file] = future.result()
+        except OSError as e:
+            print_warning(f"Could not read {cs_file}: {e}")
+    return files
+
+def _close_cs_files(files: Dict[str, bytes]) -> None:
+    """Release the memory maps _load_cs_files returned for large files"""
+    for data in files.values():
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+def _scan_files(scan_file, files: Dict[str, bytes]) -> list:
+    """Run scan_file over (path, contents) on a thread pool, returning (file, result, error) in input order"""
+    def safe_scan(item):
+        cs_file, data = item
+        try:
+            return cs_file, scan_file(cs_file, data), None
+        except Exception as e:
+            return cs_file, None, e
+    
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+        return list(executor.map(safe_scan, files.items()))
+
+def _scan_double_semicolons(cs_file: str, data: bytes) -> List[Tuple[str, int, str]]:
+    """Return the (file, line, content) double semicolon violations in a single C# file"""
+    issues = []
+    
+    # Most files have no ';;' at all, so skip the regex scan for them
+    # (find rather than `in`, which only matches single bytes on an mmap)
+    if data.find(b';;') == -1:
+        return issues
+    
+    if data.find(b'\r') != -1:
+        # Normalize line endings the way text-mode reads did, so lone-CR files
+        # are numbered like the statement-ending scan numbers them
+        data = data[:].replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    
+    rel_file = os.path.relpath(cs_file, USERBOT_ROOT_STR)
+    line_num = 1
+    last_pos = 0
+    for match in DBL_SEMI_RE.finditer(data):
+        line_num += data[last_pos:match.start()].count(b'\n')
+        last_pos = match.start()
+        
+        line_end = data.find(b'\n', match.end())
+        line = data[match.start():line_end if line_end != -1 else len(data)]
+        content = line.decode('utf-8', errors='replace').strip()
+        if content.startswith(('//', '*')):
+            continue
+        issues.append((rel_file, line_num, content))
+    
+    return issues
+
+def check_double_semicolons(cs_files: Optional[Dict[str, bytes]] = None) -> bool:
     """Check for double semicolons in C# files"""
     print_header("VERIFICATION 2: DOUBLE SEMICOLON RULE")
     
-    cs_files = list(STRATEGICMIND_DIR.rglob("*.cs"))
+    owns_files = cs_files is None
+    if owns_files:
+        cs_files = _load_cs_files(str(STRATEGICMIND_DIR))
     issues_found = []
     
-    for cs_file in cs_files:
-        try:
-            with open(cs_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                
-            for line_num, line in enumerate(lines, 1):
-                # Check for double semicolons
-                if ';;' in line:
-                    # Ignore if it's in a comment or string
-                    stripped = line.strip()
-                    if not stripped.startswith('//') and not stripped.startswith('*'):
-                        issues_found.append({
-                            'file': cs_file.relative_to(USERBOT_DIR),
-                            'line': line_num,
-                            'content': line.strip()
-                        })
-        except Exception as e:
-            print_warning(f"Could not read {cs_file}: {e}")
+    scan_results = _scan_files(_scan_double_semicolons, cs_files)
+    if owns_files:
+        _close_cs_files(cs_files)
+    
+    for cs_file, issues, error in scan_results:
+        if error is not None:
+            print_warning(f"Could not read {cs_file}: {error}")
+        else:
+            issues_found.extend(issues)
     
     if issues_found:
         print_error(f"Found {len(issues_found)} double semicolon violations:")
-        for issue in issues_found[:10]:  # Show first 10
-            print(f"  {RED}{issue['file']}:{issue['line']}{RESET}")
-            print(f"    {issue['content'][:100]}")
+        for file, line_num, content in issues_found[:10]:  # Show first 10
+            print(f"  {RED}{file}:{line_num}{RESET}")
+            print(f"    {content[:100]}")
         
         if len(issues_found) > 10:
             print(f"  ... and {len(issues_found) - 10} more")
@@ -121,80 +248,94 @@ def check_double_semicolons() -> bool:
         print_success(f"No double semicolons found in {len(cs_files)} C# files")
         return True
 
-def check_statement_endings() -> bool:
+def _strip_block_comments(data: str) -> str:
+    """Blank out every line inside a /* ... */ block, keeping newlines so line numbers still match"""
+    pieces = []
+    kept_from = 0
+    comment_start = None
+    for match in COMMENT_MARK_RE.finditer(data):
+        if '*/' in match.group():
+            # Closing line: drop it together with the rest of the block
+            start = match.start() if comment_start is None else comment_start
+            pieces.append(data[kept_from:start])
+            pieces.append('\n' * data.count('\n', start, match.end()))
+            kept_from = match.end()
+            comment_start = None
+        elif comment_start is None:
+            comment_start = match.start()
+    
+    if comment_start is not None:
+        # Unclosed block runs to the end of the file
+        pieces.append(data[kept_from:comment_start])
+        pieces.append('\n' * data.count('\n', comment_start))
+    else:
+        pieces.append(data[kept_from:])
+    return ''.join(pieces)
+
+def _scan_statement_endings(cs_file: str, raw: bytes) -> Tuple[List[Tuple[str, int, str]], int, int]:
+    """Return (violations, total statements, compliant statements) for a single C# file"""
+    issues = []
+    total = 0
+    correct = 0
+    data = str(raw, 'utf-8')
+    if '\r' in data:
+        # Normalize line endings the way text-mode reads did
+        data = data.replace('\r\n', '\n').replace('\r', '\n')
+    
+    # Drop multiline comments up front instead of tracking comment state per line
+    if '/*' in data or '*/' in data:
+        data = _strip_block_comments(data)
+    
+    rel_file = None
+    line_num = 1
+    last_pos = 0
+    for match in STMT_CANDIDATE_RE.finditer(data):
+        line_num += data.count('\n', last_pos, match.start())
+        last_pos = match.start()
+        
+        stripped = match.group().strip()
+        kind = STMT_CLASS_RE.match(stripped).lastgroup
+        if kind == 'skip':
+            continue
+        
+        total += 1
+        
+        # Check if it ends with //
+        if kind == 'done':
+            correct += 1
+        # Ignore if semicolon is inside a string literal
+        elif stripped.count('"') < 2:
+            if rel_file is None:
+                rel_file = os.path.relpath(cs_file, os.path.dirname(os.path.dirname(os.path.dirname(cs_file))))
+            issues.append((rel_file, line_num, stripped))
+    
+    return issues, total, correct
+
+def check_statement_endings(all_files: Optional[Dict[str, bytes]] = None) -> bool:
     """Check that every statement ends with //"""
     print_header("VERIFICATION 4: STATEMENT ENDING RULE (//)")
     
-    cs_files = list(STRATEGICMIND_DIR.rglob("*.cs"))
-    test_files = list(TEST_DIR.rglob("*.cs"))
-    all_files = cs_files + test_files
-    
-    # Exclude generated files
-    all_files = [f for f in all_files if not any(x in str(f) for x in ['obj/', 'bin/', '/obj\\', '\\bin\\'])]
+    # Generated files under obj/ and bin/ are pruned during the walk
+    owns_files = all_files is None
+    if owns_files:
+        all_files = {**_load_cs_files(str(STRATEGICMIND_DIR)), **_load_cs_files(str(TEST_DIR))}
     
     issues_found = []
     total_statements = 0
     correct_statements = 0
     
-    for cs_file in all_files:
-        try:
-            with open(cs_file, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-                
-            in_multiline_comment = False
-            
-            for line_num, line in enumerate(lines, 1):
-                stripped = line.strip()
-                
-                # Skip empty lines
-                if not stripped:
-                    continue
-                
-                # Handle multiline comments
-                if '/*' in stripped:
-                    in_multiline_comment = True
-                if '*/' in stripped:
-                    in_multiline_comment = False
-                    continue
-                    
-                if in_multiline_comment:
-                    continue
-                
-                # Skip XML documentation and single-line comments
-                if stripped.startswith('///') or stripped.startswith('//'):
-                    continue
-                
-                # Skip attributes
-                if stripped.startswith('[') and stripped.endswith(']'):
-                    continue
-                
-                # Check if line contains a statement ending (semicolon, property/method declaration)
-                has_semicolon = ';' in stripped
-                is_brace_only = stripped in ['{', '}', '{;', '};']
-                is_property_or_method = ('=>' in stripped or 'get;' in stripped or 'set;' in stripped)
-                
-                # Exclude for loops, LINQ continuations, and lambda expressions (not complete statements)
-                is_for_loop = stripped.startswith('for (')
-                is_linq_continuation = stripped.startswith('.')
-                is_lambda = stripped.startswith('async () =>')
-                
-                # Lines that should have // at the end
-                if (has_semicolon or is_property_or_method) and not is_brace_only and not is_for_loop and not is_linq_continuation and not is_lambda:
-                    total_statements += 1
-                    
-                    # Check if it ends with //
-                    if stripped.endswith('//'):
-                        correct_statements += 1
-                    else:
-                        # Ignore if semicolon is inside a string literal
-                        if not ('"' in stripped and stripped.count('"') >= 2):
-                            issues_found.append({
-                                'file': cs_file.relative_to(cs_file.parent.parent.parent),
-                                'line': line_num,
-                                'content': stripped[:80]
-                            })
-        except Exception as e:
-            print_warning(f"Could not read {cs_file}: {e}")
+    scan_results = _scan_files(_scan_statement_endings, all_files)
+    if owns_files:
+        _close_cs_files(all_files)
+    
+    for cs_file, result, error in scan_results:
+        if error is not None:
+            print_warning(f"Could not read {cs_file}: {error}")
+            continue
+        issues, total, correct = result
+        issues_found.extend(issues)
+        total_statements += total
+        correct_statements += correct
     
     if total_statements == 0:
         print_warning("No statements found to verify")
@@ -213,9 +354,9 @@ def check_statement_endings() -> bool:
         print_error(f"Statement ending rule compliance only {compliance_rate:.1f}%")
         if issues_found:
             print_error(f"Found {len(issues_found)} violations (showing first 15):")
-            for issue in issues_found[:15]:
-                print(f"  {RED}{issue['file']}:{issue['line']}{RESET}")
-                print(f"    {issue['content']}")
+            for file, line_num, content in issues_found[:15]:
+                print(f"  {RED}{file}:{line_num}{RESET}")
+                print(f"    {content[:80]}")
         return False
 
 def check_test_coverage() -> bool:
@@ -226,24 +367,26 @@ def check_test_coverage() -> bool:
         # First, ensure coverlet.collector is installed
         print_info("Running tests with coverage collection...")
         
-        result = subprocess.run(
-            [
-                "dotnet", "test",
-                str(TEST_DIR / "UserBot.StrategicMind.Tests.csproj"),
-                "--collect:XPlat Code Coverage",
-                "--results-directory", "./TestResults",
-                "--", "DataCollectionRunSettings.DataCollectors.DataCollector.Configuration.Format=opencover"
-            ],
-            capture_output=True,
-            text=True,
-            cwd=USERBOT_DIR
-        )
-        
-        if result.returncode != 0:
-            print_error("Tests failed to run")
-            print(result.stdout)
-            print(result.stderr)
-            return False
+        with tempfile.TemporaryFile() as test_output:
+            result = subprocess.run(
+                [
+                    "dotnet", "test",
+                    TESTS_CSPROJ,
+                    "--collect:XPlat Code Coverage",
+                    "--results-directory", "./TestResults",
+                    "--", "DataCollectionRunSettings.DataCollectors.DataCollector.Configuration.Format=opencover"
+                ],
+                stdout=test_output,
+                stderr=subprocess.PIPE,
+                text=True,
+                cwd=USERBOT_DIR
+            )
+            
+            if result.returncode != 0:
+                print_error("Tests failed to run")
+                print(_read_output(test_output))
+                print(result.stderr)
+                return False
         
         # Try to parse coverage results
         test_results_dir = USERBOT_DIR / "TestResults"
@@ -255,8 +398,8 @@ def check_test_coverage() -> bool:
         if coverage_files:
             print_info(f"Coverage files found: {len(coverage_files)}")
             # Simple coverage check - count test files vs source files
-            source_files = list(STRATEGICMIND_DIR.rglob("*.cs"))
-            test_files = list(TEST_DIR.rglob("*Tests.cs"))
+            source_files = _list_cs_files(str(STRATEGICMIND_DIR))
+            test_files = [f for f in _list_cs_files(str(TEST_DIR)) if f.endswith('Tests.cs')]
             
             coverage_ratio = (len(test_files) / len(source_files)) * 100 if source_files else 0
             
@@ -274,14 +417,21 @@ def check_test_coverage() -> bool:
             # Fallback: Count tests
             print_info("Coverage report not available, checking test count...")
             
-            result = subprocess.run(
-                ["dotnet", "test", str(TEST_DIR / "UserBot.StrategicMind.Tests.csproj"), "--list-tests"],
-                capture_output=True,
-                text=True,
+            # Count the listed tests as they stream in rather than buffering the whole listing
+            test_count = 0
+            with subprocess.Popen(
+                ["dotnet", "test", TESTS_CSPROJ, "--list-tests"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                encoding='utf-8',
+                errors='replace',
+                bufsize=1,
                 cwd=USERBOT_DIR
-            )
+            ) as proc:
+                for line in proc.stdout:
+                    if line.strip() and not line.startswith(' ') and 'Test' in line:
+                        test_count += 1
             
-            test_count = len([line for line in result.stdout.split('\n') if line.strip() and not line.startswith(' ') and 'Test' in line])
             print_info(f"Total tests found: {test_count}")
             
             if test_count >= 50:  # We have 69 tests
@@ -341,27 +491,30 @@ Console.WriteLine($"MOVE:{move}");
         print_info("Running performance test...")
         
         # Use dotnet script or create a minimal console app
-        result = subprocess.run(
-            ["dotnet", "build", str(STRATEGICMIND_DIR / "UserBot.StrategicMind.csproj")],
-            capture_output=True,
-            text=True,
+        # Build output is not inspected here, so discard it
+        subprocess.run(
+            ["dotnet", "build", STRATEGICMIND_CSPROJ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             cwd=USERBOT_DIR
         )
         
         # Since we can't easily run a script, let's check the test execution time
         print_info("Checking test execution times as proxy for API performance...")
         
-        result = subprocess.run(
-            ["dotnet", "test", str(TEST_DIR / "UserBot.StrategicMind.Tests.csproj"), "--verbosity", "quiet"],
-            capture_output=True,
-            text=True,
-            cwd=USERBOT_DIR,
-            timeout=30
-        )
+        with tempfile.TemporaryFile() as test_output:
+            subprocess.run(
+                ["dotnet", "test", TESTS_CSPROJ, "--verbosity", "quiet"],
+                stdout=test_output,
+                stderr=subprocess.DEVNULL,
+                cwd=USERBOT_DIR,
+                timeout=30
+            )
+            stdout = _read_output(test_output)
         
         # Parse test execution time from output
-        if "Total time:" in result.stdout:
-            time_match = re.search(r'Total time: ([\d.]+) Seconds', result.stdout)
+        if "Total time:" in stdout:
+            time_match = TOTAL_TIME_RE.search(stdout)
             if time_match:
                 total_time = float(time_match.group(1))
                 # 69 tests in total
@@ -397,6 +550,31 @@ Console.WriteLine($"MOVE:{move}");
         if temp_dir.exists():
             shutil.rmtree(temp_dir, ignore_errors=True)
 
+class _ThreadLocalStdout:
+    """sys.stdout stand-in that sends a thread's output to its buffer, if it has one"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+    
+    def write(self, text: str) -> int:
+        buffer = getattr(self.local, 'buffer', None)
+        return (buffer if buffer is not None else self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def _run_buffered(stdout: _ThreadLocalStdout, check) -> Tuple[bool, str]:
+    """Run a check with its output buffered, returning (passed, output)"""
+    stdout.local.buffer = io.StringIO()
+    try:
+        return check(), stdout.local.buffer.getvalue()
+    finally:
+        stdout.local.buffer = None
+
 def run_all_verifications() -> bool:
     """Run all verification checks"""
     print(f"\n{BOLD}{BLUE}")
@@ -408,12 +586,37 @@ def run_all_verifications() -> bool:
     
     results = {}
     
-    # Run each verification
-    results['compilation'] = check_compilation()
-    results['double_semicolons'] = check_double_semicolons()
-    results['statement_endings'] = check_statement_endings()
-    results['test_coverage'] = check_test_coverage()
-    results['execution_time'] = check_execution_time()
+    # Read the C# sources once; both source checks work from these contents
+    # (all_files holds every entry of source_files, so closing it releases both)
+    source_files = _load_cs_files(str(STRATEGICMIND_DIR))
+    all_files = {**source_files, **_load_cs_files(str(TEST_DIR))}
+    
+    # Run each verification. The dotnet checks share build output, so they run
+    # one after another on a single worker while the source scans run alongside.
+    # Each check's output is buffered and printed in the usual order.
+    stdout = _ThreadLocalStdout(sys.stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=1) as dotnet_pool, ThreadPoolExecutor(max_workers=2) as scan_pool:
+            futures = {
+                'compilation': dotnet_pool.submit(_run_buffered, stdout, check_compilation),
+                'double_semicolons': scan_pool.submit(_run_buffered, stdout, functools.partial(check_double_semicolons, source_files)),
+                'statement_endings': scan_pool.submit(_run_buffered, stdout, functools.partial(check_statement_endings, all_files)),
+                'test_coverage': dotnet_pool.submit(_run_buffered, stdout, check_test_coverage),
+                'execution_time': dotnet_pool.submit(_run_buffered, stdout, check_execution_time),
+            }
+            # Release the mapped sources as soon as both scans are done, rather than
+            # holding them open while the remaining dotnet checks run
+            wait([futures['double_semicolons'], futures['statement_endings']])
+            _close_cs_files(all_files)
+            
+            for check, future in futures.items():
+                results[check], output = future.result()
+                stdout.write(output)
+                stdout.flush()
+    finally:
+        sys.stdout = stdout.stream
+        _close_cs_files(all_files)
     
     # Print summary
     print_header("VERIFICATION SUMMARY")
@@ -1,36 +1,72 @@
 import requests
+import orjson
 import zipfile
 import os
+import sys
+import tempfile
+from functools import partial
 
 zip_path = r"C:\Users\saplizki\Downloads\StrategicMind_Submission.zip"
 team_name = "StrategicMind"
 
-# Extract files from ZIP
-files_data = []
-with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-    for file_name in zip_ref.namelist():
-        if file_name.endswith('/') or file_name.startswith('.'):
-            continue
-        with zip_ref.open(file_name) as file:
-            content = file.read().decode('utf-8', errors='ignore')
-            files_data.append({
-                "FileName": os.path.basename(file_name),
-                "Code": content
-            })
-
-print(f"Extracted {len(files_data)} files")
-
-# Prepare request
-payload = {
-    "TeamName": team_name,
-    "Files": files_data
-}
-
-# Call API
 url = "http://localhost:8080/api/bots/verify"
-print(f"Calling {url}...")
-response = requests.post(url, json=payload, timeout=60)
 
-print(f"\nStatus Code: {response.status_code}")
-print(f"Response:")
-print(response.json())
+# One session for every verification, so the connection to the API stays open
+session = requests.Session()
+
+
+def verify(zip_path, team_name):
+    # Build the request body incrementally: each file is decoded and written out
+    # before the next one is read, so only one file is held in memory at a time
+    with tempfile.SpooledTemporaryFile(max_size=64 << 20) as body:
+        body.write(b'{"TeamName":' + orjson.dumps(team_name) + b',"Files":[')
+
+        file_count = 0
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            for file_name in zip_ref.namelist():
+                if file_name.endswith('/') or file_name.startswith('.'):
+                    continue
+                with zip_ref.open(file_name) as file:
+                    content = file.read().decode('utf-8', errors='ignore')
+                if file_count:
+                    body.write(b',')
+                body.write(orjson.dumps({
+                    "FileName": os.path.basename(file_name),
+                    "Code": content
+                }))
+                file_count += 1
+
+        body.write(b']}')
+        body.seek(0)
+
+        print(f"Extracted {file_count} files")
+
+        # Call API, streaming the spooled body in chunks
+        print(f"Calling {url}...")
+        response = session.post(
+            url,
+            data=iter(partial(body.read, 1 << 16), b''),
+            headers={'Content-Type': 'application/json'},
+            timeout=60
+        )
+
+    print(f"\nStatus Code: {response.status_code}")
+    print(f"Response:")
+    print(response.json())
+
+
+if __name__ == "__main__":
+    if "--stdin" in sys.argv[1:] or "-" in sys.argv[1:]:
+        # Keep running and verify one "<zip path>\t<team name>" line at a time
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                zp, tn = line.split('\t')
+                verify(zp, tn)
+            except Exception as e:
+                print(f"Failed to verify {line!r}: {e}")
+            sys.stdout.flush()
+    else:
+        verify(zip_path, team_name)